@@ -0,0 +1,37 @@
+"""Shared matplotlib helpers for the plotting methods."""
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+from matplotlib import dates as mdates
+from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+
+def draw_grouped_lines(
+    ax: Axes,
+    df: pl.DataFrame,
+    id_column: str,
+    date_column: str,
+    value_column: str,
+) -> None:
+    """Draw one line per ``id_column`` group as a single LineCollection, with a legend."""
+    ordered = df.sort([id_column, date_column])
+    groups = ordered.group_by(id_column, maintain_order=True).len()
+    bounds = np.cumsum(groups["len"].to_numpy())[:-1]
+    dates = ordered[date_column].to_numpy()
+    is_temporal = ordered.schema[date_column].is_temporal()
+    x = mdates.date2num(dates) if is_temporal else dates.astype(float)
+    segments = [
+        np.column_stack(pair)
+        for pair in zip(np.split(x, bounds), np.split(ordered[value_column].to_numpy(), bounds))
+    ]
+    cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    colors = [cycle[i % len(cycle)] for i in range(len(segments))]
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=0.8))
+    ax.autoscale_view()
+    if is_temporal:
+        ax.xaxis_date()
+    ax.legend(handles=[Line2D([], [], color=color, label=str(key)) for key, color in zip(groups[id_column], colors)])
@@ -2,10 +2,108 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Sequence, Tuple
 
+import numpy as np
 import polars as pl
-import statsmodels.api as sm
+from joblib import Parallel, delayed
+from scipy.linalg import qr, solve_triangular
+
+
+def _to_xy(frame: pl.DataFrame, y_col: str, factors: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract the response and a constant-prefixed design matrix as float64 arrays."""
+    arr = frame.select(y_col, *factors).to_numpy().astype(np.float64)
+    return arr[:, 0], np.column_stack([np.ones(len(arr)), arr[:, 1:]])
+
+
+def _pad_groups(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Scatter contiguous group rows into a zero-padded ``(G, T_max, C)`` tensor."""
+    starts = np.cumsum(lengths) - lengths
+    group_idx = np.repeat(np.arange(len(lengths)), lengths)
+    positions = np.arange(len(values)) - np.repeat(starts, lengths)
+    padded = np.zeros((len(lengths), int(lengths.max()), values.shape[1]))
+    padded[group_idx, positions] = values
+    return padded
+
+
+def _rank(singular_values: np.ndarray, n_obs) -> np.ndarray:
+    """Numerical rank from singular values, with ``np.linalg.matrix_rank``'s default tolerance."""
+    tol = singular_values.max(axis=-1) * np.maximum(n_obs, singular_values.shape[-1]) * np.finfo(np.float64).eps
+    return (singular_values > np.expand_dims(tol, -1)).sum(axis=-1)
+
+
+def _ols_pinv(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Minimum-norm OLS for rank-deficient designs, as statsmodels fits them."""
+    X_pinv = np.linalg.pinv(X)
+    params = X_pinv @ y
+    resid = y - X @ params
+    ssr = resid @ resid
+    sst = ((y - y.mean()) ** 2).sum()
+    dof = len(y) - np.linalg.matrix_rank(X)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma2 = ssr / dof if dof > 0 else np.nan
+        tvalues = params / np.sqrt(sigma2 * np.einsum("ij,ij->i", X_pinv, X_pinv))
+        rsquared = 1.0 - ssr / sst
+    return params, tvalues, float(rsquared)
+
+
+def _batched_ols(
+    X: np.ndarray, y: np.ndarray, n_obs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve a stack of zero-padded OLS problems via the normal equations.
+
+    ``X`` has shape ``(G, T, P)`` and ``y`` shape ``(G, T)``; padded rows must be
+    all zeros so they drop out of every cross-product. Returns the parameters,
+    their t-statistics, and the centred R-squared for each group. Groups whose
+    design is rank deficient are refitted with ``_ols_pinv``.
+    """
+    XtX = np.einsum("gtk,gtj->gkj", X, X)
+    Xty = np.einsum("gtk,gt->gk", X, y)
+    try:
+        XtX_inv = np.linalg.inv(XtX)
+    except np.linalg.LinAlgError:
+        XtX_inv = np.linalg.pinv(XtX)
+    params = np.einsum("gkj,gj->gk", XtX_inv, Xty)
+    resid = y - np.einsum("gtk,gk->gt", X, params)
+    ssr = np.einsum("gt,gt->g", resid, resid)
+    mask = np.arange(y.shape[1]) < n_obs[:, None]
+    y_mean = y.sum(axis=1) / n_obs
+    sst = (((y - y_mean[:, None]) * mask) ** 2).sum(axis=1)
+    dof = n_obs - X.shape[2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma2 = np.where(dof > 0, ssr / np.maximum(dof, 1), np.nan)
+        std_err = np.sqrt(sigma2[:, None] * np.diagonal(XtX_inv, axis1=1, axis2=2))
+        tvalues = params / std_err
+        rsquared = 1.0 - ssr / sst
+    # Zero padding leaves the singular values, and so the rank, of each design unchanged.
+    deficient = _rank(np.linalg.svd(X, compute_uv=False), n_obs) < X.shape[2]
+    for g in np.flatnonzero(deficient):
+        params[g], tvalues[g], rsquared[g] = _ols_pinv(X[g, : n_obs[g]], y[g, : n_obs[g]])
+    return params, tvalues, rsquared
+
+
+def _ols_qr(X: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Fit a single OLS problem through an economic QR factorization.
+
+    Rank-deficient designs fall back to ``_ols_pinv``; ``R`` shares the singular
+    values of ``X``, so the rank test matches the batched path.
+    """
+    n, k = X.shape
+    if n < k:
+        return _ols_pinv(X, y)
+    Q, R = qr(X, mode="economic")
+    if _rank(np.linalg.svd(R, compute_uv=False), n) < k:
+        return _ols_pinv(X, y)
+    R_inv = solve_triangular(R, np.eye(k))
+    params = R_inv @ (Q.T @ y)
+    resid = y - X @ params
+    ssr = resid @ resid
+    sst = ((y - y.mean()) ** 2).sum()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma2 = ssr / (n - k) if n > k else np.nan
+        tvalues = params / np.sqrt(sigma2 * np.einsum("ij,ij->i", R_inv, R_inv))
+        rsquared = 1.0 - ssr / sst
+    return params, tvalues, float(rsquared)
 
 
 @dataclass
@@ -14,6 +112,8 @@ class AlphaModel:
 
     id_column: str = "fund_id"
     date_column: str = "date"
+    max_padding_ratio: float = 4.0
+    n_jobs: int = -1
 
     def time_series_regression(
         self,
@@ -21,27 +121,50 @@ class AlphaModel:
         factors: Iterable[str],
         excess_return_column: str = "excess_return",
     ) -> pl.DataFrame:
-        """Run separate regressions per fund to estimate alpha and betas."""
-        results = []
-        for fund_id, group in df.group_by(self.id_column):
-            pandas_df = group.select([self.date_column, excess_return_column, *factors]).to_pandas()
-            pandas_df = pandas_df.dropna()
-            if pandas_df.empty:
-                continue
-            y = pandas_df[excess_return_column]
-            X = sm.add_constant(pandas_df[list(factors)])
-            model = sm.OLS(y, X).fit()
-            res = {
-                self.id_column: fund_id,
-                "alpha": model.params.get("const", float("nan")),
-                "alpha_t": model.tvalues.get("const", float("nan")),
-                "r_squared": model.rsquared,
-            }
-            for factor in factors:
-                res[f"beta_{factor}"] = model.params.get(factor, float("nan"))
-                res[f"t_{factor}"] = model.tvalues.get(factor, float("nan"))
-            results.append(res)
-        return pl.DataFrame(results)
+        """Run separate regressions per fund to estimate alpha and betas.
+
+        All funds are solved together: rows are stacked into a zero-padded
+        ``(funds, periods, factors + 1)`` design tensor and the normal equations
+        are formed and solved in a single batched call. When fund histories are
+        so uneven that padding would exceed ``max_padding_ratio`` times the
+        observed rows, each fund is instead fitted by QR decomposition, spread
+        over ``n_jobs`` threads since LAPACK releases the GIL.
+        """
+        factors = list(factors)
+        data = (
+            df.select([self.id_column, excess_return_column, *factors])
+            .fill_nan(None)
+            .drop_nulls()
+            .sort(self.id_column, maintain_order=True)
+        )
+        if data.is_empty():
+            return pl.DataFrame()
+        counts = data.group_by(self.id_column, maintain_order=True).agg(pl.len().alias("n_obs"))
+        n_obs = counts["n_obs"].to_numpy().astype(np.int64)
+        y, X = _to_xy(data, excess_return_column, factors)
+        if len(n_obs) * n_obs.max() <= self.max_padding_ratio * len(y):
+            params, tvalues, rsquared = _batched_ols(
+                _pad_groups(X, n_obs), _pad_groups(y[:, None], n_obs)[:, :, 0], n_obs
+            )
+        else:
+            bounds = np.cumsum(n_obs)[:-1]
+            fits = Parallel(n_jobs=self.n_jobs, prefer="threads", batch_size=16)(
+                delayed(_ols_qr)(X_fund, y_fund)
+                for X_fund, y_fund in zip(np.split(X, bounds), np.split(y, bounds))
+            )
+            params = np.vstack([fit[0] for fit in fits])
+            tvalues = np.vstack([fit[1] for fit in fits])
+            rsquared = np.array([fit[2] for fit in fits])
+        res = {
+            self.id_column: counts[self.id_column],
+            "alpha": params[:, 0],
+            "alpha_t": tvalues[:, 0],
+            "r_squared": rsquared,
+        }
+        for k, factor in enumerate(factors, start=1):
+            res[f"beta_{factor}"] = params[:, k]
+            res[f"t_{factor}"] = tvalues[:, k]
+        return pl.DataFrame(res)
 
     def cross_sectional_regression(
         self,
@@ -49,21 +172,65 @@ class AlphaModel:
         factors: Iterable[str],
         excess_return_column: str = "excess_return",
     ) -> pl.DataFrame:
-        """Run cross-sectional regression for each date across funds."""
-        outputs = []
-        for date, group in df.group_by(self.date_column):
-            pandas_df = group.select([self.id_column, excess_return_column, *factors]).to_pandas().dropna()
-            if pandas_df.empty or len(pandas_df) < len(list(factors)):
-                continue
-            y = pandas_df[excess_return_column]
-            X = sm.add_constant(pandas_df[list(factors)])
-            model = sm.OLS(y, X).fit()
-            res = {
-                self.date_column: date,
-                "r_squared": model.rsquared,
-            }
-            for factor in factors:
-                res[f"lambda_{factor}"] = model.params.get(factor, float("nan"))
-                res[f"t_{factor}"] = model.tvalues.get(factor, float("nan"))
-            outputs.append(res)
-        return pl.DataFrame(outputs)
+        """Run cross-sectional regression for each date across funds.
+
+        Each date is one zero-padded slice of a ``(dates, funds, factors + 1)``
+        design tensor, so every cross-section is solved in one batched call.
+        """
+        factors = list(factors)
+        data = (
+            df.select([self.date_column, excess_return_column, *factors])
+            .fill_nan(None)
+            .drop_nulls()
+            .filter(pl.len().over(self.date_column) >= len(factors))
+            .sort(self.date_column, maintain_order=True)
+        )
+        if data.is_empty():
+            return pl.DataFrame()
+        if len(factors) == 1:
+            return self._cross_sectional_single_factor(data, factors[0], excess_return_column)
+        counts = data.group_by(self.date_column, maintain_order=True).agg(pl.len().alias("n_obs"))
+        n_obs = counts["n_obs"].to_numpy().astype(np.int64)
+        y, X = _to_xy(data, excess_return_column, factors)
+        params, tvalues, rsquared = _batched_ols(
+            _pad_groups(X, n_obs), _pad_groups(y[:, None], n_obs)[:, :, 0], n_obs
+        )
+        res = {
+            self.date_column: counts[self.date_column],
+            "r_squared": rsquared,
+        }
+        for k, factor in enumerate(factors, start=1):
+            res[f"lambda_{factor}"] = params[:, k]
+            res[f"t_{factor}"] = tvalues[:, k]
+        return pl.from_dict(res)
+
+    def _cross_sectional_single_factor(
+        self,
+        data: pl.DataFrame,
+        factor: str,
+        excess_return_column: str,
+    ) -> pl.DataFrame:
+        """Closed-form simple regression per date, computed entirely in Polars."""
+        return (
+            data.group_by(self.date_column, maintain_order=True)
+            .agg(
+                pl.len().alias("n_obs"),
+                pl.cov(factor, excess_return_column).alias("sxy"),
+                pl.col(factor).var(ddof=1).alias("sxx"),
+                pl.col(excess_return_column).var(ddof=1).alias("syy"),
+            )
+            .with_columns(
+                (pl.col("sxy") / pl.col("sxx")).alias(f"lambda_{factor}"),
+                (pl.col("sxy").pow(2) / (pl.col("sxx") * pl.col("syy"))).alias("r_squared"),
+            )
+            .with_columns(
+                (
+                    pl.col(f"lambda_{factor}")
+                    / (
+                        (1 - pl.col("r_squared")) * pl.col("syy")
+                        / ((pl.col("n_obs") - 2) * pl.col("sxx"))
+                    ).sqrt()
+                ).alias(f"t_{factor}")
+            )
+            .select(self.date_column, "r_squared", f"lambda_{factor}", f"t_{factor}")
+        )
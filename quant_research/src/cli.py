@@ -28,20 +28,20 @@ def _resolve_paths(root: Path) -> dict:
 def load_data(args: argparse.Namespace) -> None:
     paths = _resolve_paths(Path(args.project_root))
     loader = DataLoader(paths["data"])
-    prices = loader.load_prices("prices.csv")
-    fundamentals = loader.load_fundamentals("fundamentals.csv")
+    prices = loader.load_prices_lazy("prices.csv")
+    fundamentals = loader.load_fundamentals_lazy("fundamentals.csv")
     merged = loader.merge_data(prices, fundamentals)
     output_path = paths["reports"] / "merged_data.parquet"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    merged.write_parquet(output_path)
+    merged.sink_parquet(output_path)
     print(f"Saved merged data to {output_path}")
 
 
 def compute_scores(args: argparse.Namespace) -> None:
     paths = _resolve_paths(Path(args.project_root))
     loader = DataLoader(paths["data"])
-    prices = loader.load_prices("prices.csv")
-    fundamentals = loader.load_fundamentals("fundamentals.csv")
+    prices = loader.load_prices_lazy("prices.csv")
+    fundamentals = loader.load_fundamentals_lazy("fundamentals.csv")
     engineer = FundFeatureEngineer()
     technical = engineer.compute_technical_indicators(prices)
     merged = engineer.merge_with_fundamentals(
@@ -52,7 +52,9 @@ def compute_scores(args: argparse.Namespace) -> None:
     merged = engineer.compute_valuation_zscores(merged, ["pe_ratio", "pb_ratio"])
     risk = RiskAnalytics()
     risk_df = risk.compute_risk_metrics(merged)
-    latest = merged.sort(engineer.date_column).group_by(engineer.id_column).tail(1)
+    latest = merged.filter(
+        pl.col(engineer.date_column) == pl.col(engineer.date_column).max().over(engineer.id_column)
+    )
     risk_enriched = risk_df.join(
         latest.select(
             engineer.id_column,
@@ -68,7 +70,7 @@ def compute_scores(args: argparse.Namespace) -> None:
     scored = scorer.top_bottom_deciles(scored)
     output_path = paths["reports"] / "scored.parquet"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    scored.write_parquet(output_path)
+    scored.sink_parquet(output_path)
     print(f"Saved scores to {output_path}")
 
 
@@ -88,6 +90,7 @@ def visualize(args: argparse.Namespace) -> None:
         visualizer.quant_score_bar(df, output_path=figures_dir / "quant_scores.png")
     else:
         visualizer.rolling_metric_plot(df, metric, output_path=figures_dir / f"{metric}.png")
+    visualizer.close()
     print(f"Saved visualisation for {metric} to {figures_dir}")
 
 
@@ -1,18 +1,24 @@
 """Data loading utilities for the quant research platform."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextlib
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple, TypeVar
 
 import polars as pl
 
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
 
 @dataclass
 class DataLoader:
     """Load pricing and fundamental data using Polars."""
 
     data_dir: Path
+    _rename_cache: Dict[Tuple[str, ...], Dict[str, str]] = field(default_factory=dict, init=False, repr=False)
 
     def _resolve_path(self, file_name: str) -> Path:
         """Resolve a file path within the configured data directory."""
@@ -21,33 +27,82 @@ class DataLoader:
             raise FileNotFoundError(f"Data file not found: {path}")
         return path
 
-    def load_prices(self, file_name: str, columns: Optional[Iterable[str]] = None) -> pl.DataFrame:
-        """Load price data from a CSV file into a Polars DataFrame."""
+    def _scan(self, file_name: str) -> pl.LazyFrame:
+        """Scan a CSV, caching the parsed data in a ``.cache.parquet`` sibling.
+
+        The cache is reused while it is newer than the CSV and rewritten otherwise;
+        its dedicated suffix keeps it from clobbering a user's own Parquet files.
+        """
         path = self._resolve_path(file_name)
+        cache_path = path.with_suffix(".cache.parquet")
+        if cache_path.exists() and cache_path.stat().st_mtime_ns > path.stat().st_mtime_ns:
+            return pl.scan_parquet(cache_path)
         df = pl.read_csv(path, try_parse_dates=True)
+        try:
+            # Write beside the target and rename into place, so an interrupted or
+            # concurrent run can never leave a truncated cache that looks fresh.
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+            os.close(fd)
+            try:
+                df.write_parquet(tmp_name)
+                os.replace(tmp_name, cache_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+                raise
+        except OSError:
+            return df.lazy()
+        return pl.scan_parquet(cache_path)
+
+    def load_prices(self, file_name: str, columns: Optional[Iterable[str]] = None) -> pl.DataFrame:
+        """Load price data from a CSV file into a Polars DataFrame, with floats as Float32."""
+        path = self._resolve_path(file_name)
+        df = pl.read_csv(path, try_parse_dates=True).with_columns(pl.col(pl.Float64).cast(pl.Float32))
         if columns:
             df = df.select(list(columns))
         return df
 
+    def load_prices_lazy(self, file_name: str, columns: Optional[Iterable[str]] = None) -> pl.LazyFrame:
+        """Lazily scan price data as Float32, preferring a cached Parquet copy of the CSV."""
+        lf = self._scan(file_name).with_columns(pl.col(pl.Float64).cast(pl.Float32))
+        if columns:
+            lf = lf.select(list(columns))
+        return lf
+
     def load_fundamentals(self, file_name: str) -> pl.DataFrame:
         """Load fundamental ratios from CSV."""
         path = self._resolve_path(file_name)
         return pl.read_csv(path, try_parse_dates=True)
 
+    def load_fundamentals_lazy(self, file_name: str) -> pl.LazyFrame:
+        """Lazily scan fundamental ratios, preferring a cached Parquet copy of the CSV."""
+        return self._scan(file_name)
+
     def load_benchmark(self, file_name: str) -> pl.DataFrame:
         """Load benchmark returns for risk calculations."""
         return self.load_prices(file_name)
 
-    def clean_column_names(self, df: pl.DataFrame) -> pl.DataFrame:
-        """Standardise column names."""
-        return df.rename({col: col.strip().lower().replace(" ", "_") for col in df.columns})
+    def clean_column_names(self, df: FrameT) -> FrameT:
+        """Standardise column names, returning the frame untouched if already clean."""
+        columns = tuple(df.collect_schema().names())
+        mapping = self._rename_cache.get(columns)
+        if mapping is None:
+            mapping = {
+                col: col.strip().lower().replace(" ", "_")
+                for col in columns
+                if col != col.strip().lower().replace(" ", "_")
+            }
+            self._rename_cache[columns] = mapping
+        if not mapping:
+            return df
+        return df.rename(mapping)
 
     def merge_data(
         self,
-        price_df: pl.DataFrame,
-        fundamental_df: pl.DataFrame,
+        price_df: FrameT,
+        fundamental_df: FrameT,
         on: str = "date",
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """Merge price and fundamental data."""
         price_df = self.clean_column_names(price_df)
         fundamental_df = self.clean_column_names(fundamental_df)
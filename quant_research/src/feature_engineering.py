@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, Union
 
 import polars as pl
 
+from .data_loader import FrameT
+
 
 @dataclass
 class FundFeatureEngineer:
@@ -16,59 +18,62 @@ class FundFeatureEngineer:
 
     def compute_technical_indicators(
         self,
-        price_df: pl.DataFrame,
+        price_df: FrameT,
         price_column: str = "price",
         return_column: str = "returns",
         windows: Sequence[int] = (21, 63, 126),
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """Add returns, volatility, momentum, and drawdown features."""
-        df = price_df.sort([self.id_column, self.date_column])
-        df = df.with_columns(
-            pl.col(price_column)
-            .pct_change()
-            .over(self.id_column)
-            .alias(return_column)
-        )
-        df = df.with_columns(
-            pl.col(return_column)
-            .cumsum()
-            .over(self.id_column)
-            .alias("cumulative_return")
-        )
-        df = df.with_columns(
-            (pl.col(price_column) / pl.col(price_column).cum_max().over(self.id_column) - 1).alias("drawdown")
-        )
+        rolling = []
         for window in windows:
-            df = df.with_columns(
-                pl.col(return_column)
-                .rolling_std(window)
-                .over(self.id_column)
-                .alias(f"volatility_{window}")
+            rolling.extend(
+                [
+                    pl.col(return_column)
+                    .rolling_std(window)
+                    .over(self.id_column)
+                    .alias(f"volatility_{window}"),
+                    pl.col(return_column)
+                    .rolling_sum(window)
+                    .over(self.id_column)
+                    .alias(f"momentum_{window}"),
+                    pl.col(return_column)
+                    .rolling_mean(window)
+                    .over(self.id_column)
+                    .alias(f"avg_return_{window}"),
+                ]
             )
-            df = df.with_columns(
-                pl.col(return_column)
-                .rolling_sum(window)
+        out = (
+            price_df.lazy()
+            .sort([self.id_column, self.date_column])
+            .with_columns(
+                pl.col(price_column)
+                .pct_change()
+                .cast(pl.Float32)
                 .over(self.id_column)
-                .alias(f"momentum_{window}")
+                .alias(return_column),
+                (pl.col(price_column) / pl.col(price_column).cum_max().over(self.id_column) - 1).alias("drawdown"),
             )
-            df = df.with_columns(
+            .with_columns(
                 pl.col(return_column)
-                .rolling_mean(window)
+                .cum_sum()
                 .over(self.id_column)
-                .alias(f"avg_return_{window}")
+                .alias("cumulative_return"),
+                *rolling,
             )
-        return df
+        )
+        return out if isinstance(price_df, pl.LazyFrame) else out.collect()
 
     def merge_with_fundamentals(
         self,
-        technical_df: pl.DataFrame,
-        fundamental_df: pl.DataFrame,
+        technical_df: FrameT,
+        fundamental_df: Union[pl.DataFrame, pl.LazyFrame],
         fundamental_columns: Iterable[str],
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """Merge engineered technical indicators with fundamental ratios."""
         cols = [self.id_column, self.date_column, *fundamental_columns]
-        fundamentals = fundamental_df.select(cols)
-        return technical_df.join(fundamentals, on=[self.id_column, self.date_column], how="left")
+        fundamentals = fundamental_df.lazy().select(cols)
+        out = technical_df.lazy().join(fundamentals, on=[self.id_column, self.date_column], how="left")
+        return out if isinstance(technical_df, pl.LazyFrame) else out.collect()
 
     def compute_rolling_correlations(
         self,
@@ -79,34 +84,33 @@ class FundFeatureEngineer:
     ) -> pl.DataFrame:
         """Compute rolling correlations with a benchmark."""
         df = df.sort([self.id_column, self.date_column])
-        correlations = (
-            df.lazy()
-            .groupby(self.id_column)
-            .agg(
-                pl.pearson_corr(target_column, benchmark_column)
-                .rolling_mean(window)
-                .alias(f"rolling_corr_{window}")
-            )
-            .explode(f"rolling_corr_{window}")
-            .collect()
+        return df.with_columns(
+            pl.rolling_corr(target_column, benchmark_column, window_size=window)
+            .over(self.id_column)
+            .alias(f"rolling_corr_{window}")
         )
-        return df.join(correlations, on=[self.id_column])
 
     def compute_valuation_zscores(
         self,
-        df: pl.DataFrame,
+        df: FrameT,
         valuation_columns: Iterable[str],
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """Compute cross-sectional z-scores for valuation metrics."""
-        df = df.sort(self.date_column)
-        for column in valuation_columns:
-            df = df.with_columns(
-                (
-                    (pl.col(column) - pl.col(column).mean().over(self.date_column))
-                    / pl.col(column).std(ddof=1).over(self.date_column)
-                ).alias(f"{column}_zscore")
+        cols = list(valuation_columns)
+        stats = df.lazy().group_by(self.date_column).agg(
+            [pl.col(c).mean().alias(f"_m_{c}") for c in cols]
+            + [pl.col(c).std(ddof=1).alias(f"_s_{c}") for c in cols]
+        )
+        out = (
+            df.lazy()
+            .join(stats, on=self.date_column, how="left")
+            .with_columns(
+                [((pl.col(c) - pl.col(f"_m_{c}")) / pl.col(f"_s_{c}")).alias(f"{c}_zscore") for c in cols]
             )
-        return df
+            .drop([f"_m_{c}" for c in cols] + [f"_s_{c}" for c in cols])
+            .sort(self.date_column)
+        )
+        return out if isinstance(df, pl.LazyFrame) else out.collect()
 
     def compute_relative_ranks(self, df: pl.DataFrame, columns: Iterable[str]) -> pl.DataFrame:
         """Rank funds cross-sectionally for each date."""
@@ -23,10 +23,14 @@ class PredictiveModel:
     target_column: str = "excess_return"
 
     def _prepare_data(self, df: pl.DataFrame, feature_columns: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
-        pandas_df = df.select([*feature_columns, self.target_column]).to_pandas().dropna()
-        X = pandas_df[feature_columns].values
-        y = pandas_df[self.target_column].values
-        return X, y
+        columns = [*feature_columns, self.target_column]
+        arr = (
+            df.select(pl.col(columns).cast(pl.Float64))
+            .fill_nan(None)
+            .drop_nulls()
+            .to_numpy()
+        )
+        return arr[:, :-1], arr[:, -1]
 
     def fit_regression(self, df: pl.DataFrame, feature_columns: Iterable[str], model_type: str = "lasso") -> dict:
         X, y = self._prepare_data(df, feature_columns)
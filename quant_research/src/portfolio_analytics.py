@@ -6,6 +6,7 @@ from typing import Iterable, Optional
 
 import numpy as np
 import polars as pl
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
 
 
 @dataclass
@@ -16,40 +17,38 @@ class PortfolioAnalytics:
     date_column: str = "date"
 
     def _equal_weight(self, df: pl.DataFrame) -> pl.DataFrame:
-        weights = (
-            df.group_by([self.date_column])
-            .agg(pl.len().alias("count"))
-            .with_columns((1 / pl.col("count")).alias("weight"))
-        )
-        return df.join(weights.select(self.date_column, "weight"), on=self.date_column)
+        return df.with_columns((1.0 / pl.len().over(self.date_column)).alias("weight"))
 
     def _compute_portfolio_returns(self, df: pl.DataFrame) -> pl.DataFrame:
         return df.with_columns((pl.col("weight") * pl.col("returns")).alias("weighted_return"))
 
     def simulate_equal_weighted(self, df: pl.DataFrame) -> pl.DataFrame:
-        weighted = self._equal_weight(df)
-        weighted = self._compute_portfolio_returns(weighted)
-        portfolio = (
+        weighted = self._compute_portfolio_returns(self._equal_weight(df))
+        return (
             weighted.group_by(self.date_column)
             .agg(pl.col("weighted_return").sum().alias("portfolio_return"))
             .sort(self.date_column)
         )
-        return portfolio
 
     def simulate_optimized(self, df: pl.DataFrame, risk_aversion: float = 10.0) -> pl.DataFrame:
-        pandas_df = df.select([self.date_column, self.id_column, "returns"]).to_pandas()
-        pivot = pandas_df.pivot(index=self.date_column, columns=self.id_column, values="returns").dropna()
-        mean_returns = pivot.mean().values
-        cov = pivot.cov().values
-        inv = np.linalg.pinv(cov * risk_aversion)
-        weights = inv @ mean_returns
+        pivot = (
+            df.pivot(index=self.date_column, on=self.id_column, values="returns")
+            .drop_nulls()
+            .sort(self.date_column)
+        )
+        returns = pivot.drop(self.date_column).to_numpy().astype(np.float64)
+        mean_returns = returns.mean(axis=0)
+        cov = np.cov(returns, rowvar=False) * risk_aversion
+        cov += 1e-10 * np.eye(len(mean_returns))
+        try:
+            weights = cho_solve(cho_factor(cov, lower=True), mean_returns)
+        except LinAlgError:
+            weights = np.linalg.lstsq(cov, mean_returns, rcond=None)[0]
         weights /= weights.sum()
-        portfolio_returns = pivot.values @ weights
-        result = pl.DataFrame({
-            self.date_column: pivot.index,
-            "portfolio_return": portfolio_returns,
+        return pl.DataFrame({
+            self.date_column: pivot[self.date_column],
+            "portfolio_return": returns @ weights,
         })
-        return result
 
     def rolling_performance(self, returns_df: pl.DataFrame, window: int = 63) -> pl.DataFrame:
         df = returns_df.sort(self.date_column)
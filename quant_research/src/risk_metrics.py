@@ -8,6 +8,9 @@ from typing import Iterable, Optional, Sequence
 import polars as pl
 from matplotlib import pyplot as plt
 
+from ._plotting import draw_grouped_lines
+from .data_loader import FrameT
+
 
 @dataclass
 class RiskAnalytics:
@@ -29,57 +32,40 @@ class RiskAnalytics:
 
     def compute_risk_metrics(
         self,
-        df: pl.DataFrame,
+        df: FrameT,
         benchmark_returns: Optional[pl.Series] = None,
         risk_free_rate: float = 0.0,
-    ) -> pl.DataFrame:
+    ) -> FrameT:
         """Compute volatility, skew, kurtosis, beta, tracking error, Sharpe, Sortino, and drawdown."""
-        df = df.sort([self.id_column, self.date_column])
-        returns = df.select(self.id_column, self.date_column, "returns")
-        if "returns" not in df.columns:
+        if "returns" not in df.collect_schema().names():
             raise ValueError("Input DataFrame must include a 'returns' column.")
-        group = returns.group_by(self.id_column)
-        summary = group.agg(
-            [
-                pl.col(self.date_column).max().alias(self.date_column),
-                pl.col("returns").std().alias("volatility"),
-                pl.col("returns").skew().alias("skew"),
-                pl.col("returns").kurtosis().alias("kurtosis"),
-                pl.col("returns").mean().alias("avg_return"),
-                pl.col("returns").count().alias("n_obs"),
-                pl.col("returns").min().alias("min_return"),
-            ]
-        )
-        sharpe = (
-            summary
+        df = df.sort([self.id_column, self.date_column]).with_columns(pl.col("returns").cast(pl.Float32))
+        cumulative = pl.col("returns").cum_sum()
+        result = (
+            df.group_by(self.id_column)
+            .agg(
+                [
+                    pl.col(self.date_column).max().alias(self.date_column),
+                    pl.col("returns").std().alias("volatility"),
+                    pl.col("returns").skew().alias("skew"),
+                    pl.col("returns").kurtosis().alias("kurtosis"),
+                    pl.col("returns").mean().alias("avg_return"),
+                    pl.col("returns").count().alias("n_obs"),
+                    pl.col("returns").min().alias("min_return"),
+                    (pl.col("returns") - risk_free_rate)
+                    .clip(upper_bound=0.0)
+                    .pow(2)
+                    .mean()
+                    .sqrt()
+                    .alias("downside_deviation"),
+                    (cumulative - cumulative.cum_max()).min().alias("max_drawdown"),
+                ]
+            )
             .with_columns(
-                ((pl.col("avg_return") - risk_free_rate) / pl.col("volatility")).alias("sharpe_ratio")
+                ((pl.col("avg_return") - risk_free_rate) / pl.col("volatility")).alias("sharpe_ratio"),
+                ((pl.col("avg_return") - risk_free_rate) / pl.col("downside_deviation")).alias("sortino_ratio"),
             )
         )
-        downside = group.agg(
-            pl.col("returns")
-            .map_elements(lambda x: min(x - risk_free_rate, 0.0))
-            .pow(2)
-            .mean()
-            .sqrt()
-            .alias("downside_deviation")
-        )
-        sortino = sharpe.join(downside, on=self.id_column)
-        sortino = sortino.with_columns(
-            ((pl.col("avg_return") - risk_free_rate) / pl.col("downside_deviation")).alias("sortino_ratio")
-        )
-        result = sharpe.join(sortino.select(self.id_column, "downside_deviation", "sortino_ratio"), on=self.id_column)
-        df = df.with_columns(
-            pl.col("returns")
-            .cum_sum()
-            .over(self.id_column)
-            .alias("cumulative_return")
-        )
-        df = df.with_columns(
-            (pl.col("cumulative_return") - pl.col("cumulative_return").cum_max().over(self.id_column)).alias("drawdown")
-        )
-        max_dd = df.group_by(self.id_column).agg(pl.col("drawdown").min().alias("max_drawdown"))
-        result = result.join(max_dd, on=self.id_column)
         if benchmark_returns is not None:
             beta = df.with_columns(
                 pl.cov("returns", benchmark_returns).alias("covariance")
@@ -117,9 +103,22 @@ class RiskAnalytics:
             results.append(rolling)
         return pl.concat(results)
 
-    def rolling_sharpe(self, df: pl.DataFrame, window: int, risk_free_rate: float = 0.0) -> pl.DataFrame:
-        df = df.sort([self.id_column, self.date_column])
-        return df.with_columns(
+    def rolling_sharpe(
+        self,
+        df: FrameT,
+        window: int,
+        risk_free_rate: float = 0.0,
+        assume_sorted: bool = False,
+    ) -> FrameT:
+        """Add a per-fund rolling Sharpe ratio.
+
+        Pass ``assume_sorted=True`` when the input is already ordered by fund and
+        date (e.g. straight from ``compute_technical_indicators``) to skip the sort.
+        """
+        out = df.lazy()
+        if not assume_sorted:
+            out = out.sort([self.id_column, self.date_column])
+        out = out.with_columns(
             (
                 (pl.col("returns").rolling_mean(window) - risk_free_rate)
                 / pl.col("returns").rolling_std(window)
@@ -127,6 +126,7 @@ class RiskAnalytics:
             .over(self.id_column)
             .alias("rolling_sharpe")
         )
+        return out if isinstance(df, pl.LazyFrame) else out.collect()
 
     def tidy_long(self, df: pl.DataFrame, metric_columns: Iterable[str]) -> pl.DataFrame:
         return df.melt(id_vars=[self.id_column], value_vars=list(metric_columns), variable_name="metric", value_name="value")
@@ -147,10 +147,8 @@ class RiskAnalytics:
 
     def plot_rolling_sharpe(self, df: pl.DataFrame, output_path: Optional[Path] = None) -> None:
         fig, ax = plt.subplots(figsize=(10, 4))
-        for fund_id, group in df.group_by(self.id_column):
-            ax.plot(group[self.date_column], group["rolling_sharpe"], label=str(fund_id))
+        draw_grouped_lines(ax, df, self.id_column, self.date_column, "rolling_sharpe")
         ax.set_title("Rolling Sharpe Ratio")
-        ax.legend()
         ax.set_xlabel("Date")
         ax.set_ylabel("Sharpe")
         fig.tight_layout()
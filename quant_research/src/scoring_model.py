@@ -1,13 +1,24 @@
 """Unified scoring engine for combining technical, fundamental, and risk metrics."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 import polars as pl
 import yaml
 
+from .data_loader import FrameT
+
+
+@lru_cache(maxsize=32)
+def _load_weights(path: str, mtime: float) -> Tuple[Tuple[str, float], ...]:
+    """Parse scoring weights from YAML, cached per file path and modification time."""
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.safe_load(handle)
+    return tuple(data.get("weights", {}).items())
+
 
 @dataclass
 class ScoreConfig:
@@ -17,9 +28,8 @@ class ScoreConfig:
 
     @classmethod
     def from_yaml(cls, path: Path) -> "ScoreConfig":
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
-        return cls(weights=data.get("weights", {}))
+        path = Path(path)
+        return cls(weights=dict(_load_weights(str(path), path.stat().st_mtime)))
 
 
 @dataclass
@@ -29,44 +39,59 @@ class ScoringEngine:
     config: ScoreConfig
     id_column: str = "fund_id"
     date_column: str = "date"
+    _metrics: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _score_expr: pl.Expr = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._metrics = tuple(self.config.weights)
+        self._score_expr = sum(
+            pl.col(f"{metric}_z") * weight for metric, weight in self.config.weights.items()
+        )
 
-    def _validate_columns(self, df: pl.DataFrame) -> None:
-        missing = [col for col in self.config.weights if col not in df.columns]
+    def _validate_columns(self, df: FrameT) -> None:
+        columns = df.collect_schema().names()
+        missing = [col for col in self.config.weights if col not in columns]
         if missing:
             raise KeyError(f"Missing metrics for scoring: {missing}")
 
-    def compute_zscores(self, df: pl.DataFrame, metric_columns: Iterable[str]) -> pl.DataFrame:
-        df = df.sort(self.date_column)
-        for column in metric_columns:
-            df = df.with_columns(
-                (
-                    (pl.col(column) - pl.col(column).mean().over(self.date_column))
-                    / pl.col(column).std(ddof=1).over(self.date_column)
-                ).alias(f"{column}_z")
+    def compute_zscores(self, df: FrameT, metric_columns: Iterable[str]) -> FrameT:
+        metrics = list(metric_columns)
+        stats = df.lazy().group_by(self.date_column).agg(
+            [pl.col(c).mean().alias(f"{c}__m") for c in metrics]
+            + [pl.col(c).std(ddof=1).alias(f"{c}__s") for c in metrics]
+        )
+        out = (
+            df.lazy()
+            .join(stats, on=self.date_column, how="left")
+            .with_columns(
+                [((pl.col(c) - pl.col(f"{c}__m")) / pl.col(f"{c}__s")).alias(f"{c}_z") for c in metrics]
             )
-        return df
+            .drop([f"{c}__m" for c in metrics] + [f"{c}__s" for c in metrics])
+            .sort(self.date_column)
+        )
+        return out if isinstance(df, pl.LazyFrame) else out.collect()
 
-    def compute_scores(self, df: pl.DataFrame) -> pl.DataFrame:
+    def compute_scores(self, df: FrameT) -> FrameT:
         self._validate_columns(df)
-        z_df = self.compute_zscores(df, self.config.weights.keys())
-        score_expr = sum(
-            pl.col(f"{metric}_z") * weight for metric, weight in self.config.weights.items()
-        )
-        z_df = z_df.with_columns(score_expr.alias("quant_score"))
+        z_df = self.compute_zscores(df, self._metrics)
+        z_df = z_df.with_columns(self._score_expr.alias("quant_score"))
         z_df = z_df.with_columns(
-            pl.col("quant_score").rank("ordinal").over(self.date_column).alias("quant_rank")
+            pl.col("quant_score").rank("ordinal", descending=True).over(self.date_column).alias("quant_rank")
         )
         return z_df
 
-    def top_bottom_deciles(self, df: pl.DataFrame) -> pl.DataFrame:
-        df = df.with_columns(
-            (pl.col("quant_rank") / pl.col("quant_rank").max().over(self.date_column)).alias("quant_percentile")
-        )
+    def top_bottom_deciles(self, df: FrameT) -> FrameT:
+        n_funds = pl.len().over(self.date_column)
+        # Average ranks give tied scores one shared percentile, so ties never straddle a cut-off.
+        percentile = (pl.col("quant_score").rank("average").over(self.date_column) - 1) / (n_funds - 1)
+        # A lone fund has no cross-section to be ranked against.
         return df.with_columns(
-            pl.when(pl.col("quant_percentile") <= 0.1)
-            .then("top_decile")
-            .when(pl.col("quant_percentile") >= 0.9)
-            .then("bottom_decile")
-            .otherwise("middle")
+            pl.when(n_funds < 2)
+            .then(pl.lit("middle"))
+            .when(percentile >= 0.9)
+            .then(pl.lit("top_decile"))
+            .when(percentile <= 0.1)
+            .then(pl.lit("bottom_decile"))
+            .otherwise(pl.lit("middle"))
             .alias("quant_bucket")
         )
@@ -1,14 +1,147 @@
 """Statistical evaluation tools for fund time series."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
 
+import numpy as np
 import polars as pl
+from joblib import Parallel, delayed, effective_n_jobs
 from matplotlib import pyplot as plt
-from statsmodels.stats.stattools import durbin_watson, jarque_bera
-from statsmodels.tsa.stattools import adfuller, coint
+from scipy.stats import chi2
+from statsmodels.tsa.adfvalues import mackinnonp
+from statsmodels.tsa.stattools import adfuller
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+_SQRTEPS = np.sqrt(np.finfo(np.float64).eps)
+# Fund pairs per block in plot_rolling_r_squared, bounding its working memory to O(T * block).
+_PAIR_BLOCK = 256
+
+_DIAGNOSTIC_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "adf": ("adf_stat", "adf_pvalue"),
+    "dw": ("durbin_watson",),
+    "jb": ("jarque_bera", "jb_pvalue"),
+}
+
+
+def _adf_one(series: np.ndarray) -> Tuple[float, float]:
+    result = adfuller(series, autolag="AIC")
+    return float(result[0]), float(result[1])
+
+
+@njit(cache=True, nogil=True)
+def _adf_stat_into(
+    y: np.ndarray,
+    maxlag: int,
+    Xt: np.ndarray,
+    target: np.ndarray,
+    fitted: np.ndarray,
+    XtX: np.ndarray,
+    Xty: np.ndarray,
+) -> float:
+    """ADF t-statistic without constant or trend for a fixed lag length.
+
+    Matches ``adfuller(y, maxlag=maxlag, autolag=None, regression="n")[0]``. The
+    transposed design ``Xt`` ``(maxlag + 1, nobs)`` and the other buffers are
+    overwritten, so callers testing many equal-length series allocate them once.
+    """
+    k, nobs = Xt.shape
+    Xt[0, :] = y[maxlag : maxlag + nobs]
+    for j in range(1, k):
+        np.subtract(y[maxlag - j + 1 : maxlag - j + 1 + nobs], y[maxlag - j : maxlag - j + nobs], Xt[j])
+    np.subtract(y[maxlag + 1 :], y[maxlag:-1], target)
+    for a in range(k):
+        Xty[a] = np.dot(Xt[a], target)
+        for b in range(a, k):
+            XtX[a, b] = XtX[b, a] = np.dot(Xt[a], Xt[b])
+    XtX_inv = np.linalg.inv(XtX)
+    beta = XtX_inv @ Xty
+    np.dot(beta, Xt, fitted)
+    np.subtract(target, fitted, fitted)
+    sigma2 = np.dot(fitted, fitted) / (nobs - k)
+    return beta[0] / np.sqrt(sigma2 * XtX_inv[0, 0])
+
+
+@njit(cache=True, nogil=True)
+def _adf_stats_block(
+    centred: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    beta: np.ndarray,
+    skip: np.ndarray,
+    maxlag: int,
+    out: np.ndarray,
+) -> None:
+    """Write the ADF statistic of each pair's Engle-Granger residual into ``out``.
+
+    Residuals ``centred[:, a] - beta * centred[:, b]`` are built one pair at a
+    time in a reused buffer, and the regression buffers are shared as well, so
+    memory stays O(T) per block whatever the number of pairs.
+    """
+    k = maxlag + 1
+    n_dates = centred.shape[0]
+    nobs = n_dates - 1 - maxlag
+    resid = np.empty(n_dates)
+    Xt = np.empty((k, nobs))
+    target = np.empty(nobs)
+    fitted = np.empty(nobs)
+    XtX = np.empty((k, k))
+    Xty = np.empty(k)
+    for p in range(idx_a.shape[0]):
+        if skip[p]:
+            out[p] = -np.inf
+            continue
+        np.multiply(centred[:, idx_b[p]], beta[p], resid)
+        np.subtract(centred[:, idx_a[p]], resid, resid)
+        out[p] = _adf_stat_into(resid, maxlag, Xt, target, fitted, XtX, Xty)
+
+
+def _jb_one(series: np.ndarray) -> Tuple[float, float]:
+    """Jarque-Bera statistic and p-value from the series' central moments."""
+    x = series - series.mean()
+    x2 = x * x
+    m2 = x2.mean()
+    skew = (x2 * x).mean() / m2**1.5
+    kurtosis = (x2 * x2).mean() / (m2 * m2)
+    stat = float(len(x) / 6.0 * (skew * skew + 0.25 * (kurtosis - 3.0) ** 2))
+    return stat, float(chi2.sf(stat, 2))
+
+
+def _diagnostics_one(values: np.ndarray, tests: Sequence[str], dtype: type = np.float32) -> Tuple[float, ...]:
+    """Selected diagnostics for one fund from a single ``(n, 1 or 2)`` array.
+
+    Column 0 is the tested series and the last column the residuals used for
+    Durbin-Watson; results follow the order of ``_DIAGNOSTIC_COLUMNS``. The
+    Durbin-Watson and Jarque-Bera reductions run in ``dtype``, while ADF
+    always gets float64 since ``adfuller`` upcasts internally anyway.
+    """
+    narrow = values.astype(dtype, copy=False)
+    series, resid = narrow[:, 0], narrow[:, -1]
+    out: List[float] = []
+    if "adf" in tests:
+        out.extend(_adf_one(values[:, 0].astype(np.float64)))
+    if "dw" in tests:
+        diff = np.diff(resid)
+        out.append(float(diff @ diff / (resid @ resid)))
+    if "jb" in tests:
+        out.extend(_jb_one(series))
+    return tuple(out)
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window``-row sums of each column, one row per complete window."""
+    cumulative = np.concatenate([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    return cumulative[window:] - cumulative[:-window]
 
 
 @dataclass
@@ -17,61 +150,179 @@ class StatisticalEvaluator:
 
     id_column: str = "fund_id"
     date_column: str = "date"
+    n_jobs: int = -1
+    precision: Literal["f32", "f64"] = "f32"
+    min_abs_corr: float = 0.3
+    _pivot_cache: Dict[Tuple[int, str], Tuple[pl.DataFrame, List[str], pl.Series, np.ndarray]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def _dtype(self) -> type:
+        return np.float32 if self.precision == "f32" else np.float64
+
+    def _partition(self, df: pl.DataFrame, *columns: str) -> Tuple[List, List[np.ndarray]]:
+        """Split ``columns`` into date-ordered ``(n, len(columns))`` arrays per fund with a single sort."""
+        groups = df.sort(self.date_column).select(self.id_column, *columns).partition_by(
+            self.id_column, as_dict=True, maintain_order=True, include_key=False
+        )
+        return [key[0] for key in groups], [part.to_numpy() for part in groups.values()]
+
+    def _get_pivot(
+        self, df: pl.DataFrame, value_column: str, complete: bool = False
+    ) -> Tuple[List[str], pl.Series, np.ndarray]:
+        """Date-sorted wide matrix of ``value_column``, cached per frame object.
+
+        Returns the fund labels, the dates and a read-only column-major float64
+        matrix with NaN where a fund has no value. ``complete`` keeps only dates
+        on which every fund is observed. The cache holds a reference to ``df`` so
+        the ``id`` key cannot be recycled, and is dropped as soon as a different
+        frame is passed in.
+        """
+        key = (id(df), value_column)
+        entry = self._pivot_cache.get(key)
+        if entry is None or entry[0] is not df:
+            pivot = df.pivot(index=self.date_column, on=self.id_column, values=value_column).sort(
+                self.date_column
+            )
+            funds = [col for col in pivot.columns if col != self.date_column]
+            mat = np.asfortranarray(pivot.drop(self.date_column).to_numpy(), dtype=np.float64)
+            mat.flags.writeable = False
+            self._pivot_cache = {
+                cached: value for cached, value in self._pivot_cache.items() if value[0] is df
+            }
+            entry = self._pivot_cache[key] = (df, funds, pivot[self.date_column], mat)
+        _, funds, dates, mat = entry
+        if complete:
+            rows = ~np.isnan(mat).any(axis=1)
+            if not rows.all():
+                return funds, dates.filter(rows), np.asfortranarray(mat[rows])
+        return funds, dates, mat
+
+    def run_all_diagnostics(
+        self,
+        df: pl.DataFrame,
+        value_column: str,
+        residual_column: Optional[str] = None,
+        tests: Sequence[str] = ("adf", "dw", "jb"),
+    ) -> pl.DataFrame:
+        """ADF, Durbin-Watson and Jarque-Bera per fund in one pass over the groups.
+
+        Each fund's series is extracted once and every requested test runs on
+        it in the same worker. Durbin-Watson uses ``residual_column`` when given,
+        otherwise ``value_column``; it and Jarque-Bera are computed at ``precision``.
+        """
+        unknown = set(tests) - set(_DIAGNOSTIC_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown diagnostics: {sorted(unknown)}")
+        tests = [test for test in _DIAGNOSTIC_COLUMNS if test in tests]
+        columns = [value_column]
+        if residual_column and residual_column != value_column:
+            columns.append(residual_column)
+        fund_ids, arrays = self._partition(df, *columns)
+        names = [name for test in tests for name in _DIAGNOSTIC_COLUMNS[test]]
+        # One contiguous row per statistic, filled as worker results stream back.
+        out = np.empty((len(names), len(arrays)))
+        results = Parallel(n_jobs=self.n_jobs, backend="loky", return_as="generator")(
+            delayed(_diagnostics_one)(values, tests, self._dtype) for values in arrays
+        )
+        for i, row in enumerate(results):
+            out[:, i] = row
+        return pl.DataFrame({self.id_column: fund_ids, **dict(zip(names, out))})
 
     def stationarity_tests(self, df: pl.DataFrame, value_column: str) -> pl.DataFrame:
-        outputs = []
-        for fund_id, group in df.group_by(self.id_column):
-            series = group.sort(self.date_column)[value_column].to_numpy()
-            result = adfuller(series, autolag="AIC")
-            outputs.append({
-                self.id_column: fund_id,
-                "adf_stat": float(result[0]),
-                "adf_pvalue": float(result[1]),
-            })
-        return pl.DataFrame(outputs)
+        return self.run_all_diagnostics(df, value_column, tests=("adf",))
 
     def autocorrelation_test(self, df: pl.DataFrame, residual_column: str) -> pl.DataFrame:
-        metrics = []
-        for fund_id, group in df.group_by(self.id_column):
-            series = group[residual_column].to_numpy()
-            metrics.append({
-                self.id_column: fund_id,
-                "durbin_watson": float(durbin_watson(series)),
-            })
-        return pl.DataFrame(metrics)
+        resid = pl.col(residual_column).cast(pl.Float32 if self.precision == "f32" else pl.Float64)
+        return (
+            df.sort([self.id_column, self.date_column])
+            .group_by(self.id_column, maintain_order=True)
+            .agg((resid.diff().pow(2).sum() / resid.pow(2).sum()).alias("durbin_watson"))
+        )
 
     def normality_test(self, df: pl.DataFrame, value_column: str) -> pl.DataFrame:
-        metrics = []
-        for fund_id, group in df.group_by(self.id_column):
-            series = group[value_column].to_numpy()
-            stat, pvalue, _, _ = jarque_bera(series)
-            metrics.append({
-                self.id_column: fund_id,
-                "jarque_bera": float(stat),
-                "jb_pvalue": float(pvalue),
-            })
-        return pl.DataFrame(metrics)
+        return self.run_all_diagnostics(df, value_column, tests=("jb",))
 
     def cointegration_test(self, df: pl.DataFrame, value_column: str) -> pl.DataFrame:
-        funds = df.select(self.id_column).unique()[self.id_column].to_list()
-        outputs = []
-        for i, fund_a in enumerate(funds):
-            for fund_b in funds[i + 1 :]:
-                series_a = df.filter(pl.col(self.id_column) == fund_a)[value_column].to_numpy()
-                series_b = df.filter(pl.col(self.id_column) == fund_b)[value_column].to_numpy()
-                stat, pvalue, _ = coint(series_a, series_b)
-                outputs.append({
-                    "fund_a": fund_a,
-                    "fund_b": fund_b,
-                    "coint_stat": float(stat),
-                    "coint_pvalue": float(pvalue),
-                })
-        return pl.DataFrame(outputs)
+        """Engle-Granger test for every fund pair, with all pair regressions done at once.
+
+        Each pair regresses ``fund_a`` on ``fund_b``; betas come from one cross-product
+        of the demeaned date-aligned matrix, and only the ADF step runs per pair,
+        in parallel and with the lag length fixed by Schwert's rule. Pairs are
+        split into one contiguous block per worker so each block reuses a single
+        set of regression and residual buffers. Pairs whose absolute correlation is below
+        ``min_abs_corr`` cannot plausibly be cointegrated and are reported with
+        NaN statistics without running the ADF step.
+
+        Only dates on which every fund is observed are used, so every pair is
+        tested on the history common to the whole panel; a late-launched fund
+        shortens the sample for all pairs.
+        """
+        # Column-major so each fund, and each derived residual series, is contiguous.
+        funds, _, mat = self._get_pivot(df, value_column, complete=True)
+        maxlag = int(12 * (len(mat) / 100) ** 0.25)
+        # The lagged ADF regression has len(mat) - 1 - maxlag rows and maxlag + 1
+        # regressors; it needs residual degrees of freedom to be meaningful.
+        if len(mat) - 1 - maxlag <= maxlag + 1:
+            raise ValueError(
+                f"{len(mat)} aligned dates are too few for an ADF lag length of {maxlag}; "
+                "maxlag must be less than (nobs/2 - 1)"
+            )
+        means = mat.mean(axis=0)
+        centred = np.asfortranarray(mat - means)
+        cross = centred.T @ centred
+        idx_a, idx_b = np.triu_indices(len(funds), k=1)
+        sxx = np.diag(cross)
+        sxy = cross[idx_a, idx_b]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsquared = sxy**2 / (sxx[idx_a] * sxx[idx_b])
+        # rsquared is the squared pair correlation, so this is the |rho| prefilter.
+        keep = np.flatnonzero(rsquared >= self.min_abs_corr**2)
+        keep_a, keep_b = idx_a[keep], idx_b[keep]
+        beta = sxy[keep] / sxx[keep_b]
+        # A perfect fit leaves no residual to test; report it as infinitely stationary.
+        skip = rsquared[keep] >= 1 - 100 * _SQRTEPS
+        kept_stats = np.full(len(keep), np.nan)
+        n_chunks = max(1, min(effective_n_jobs(self.n_jobs), len(keep)))
+        bounds = np.linspace(0, len(keep), n_chunks + 1).astype(int)
+        # Workers write into views of kept_stats, so they must share this process's memory.
+        Parallel(n_jobs=self.n_jobs, require="sharedmem")(
+            delayed(_adf_stats_block)(
+                centred, keep_a[lo:hi], keep_b[lo:hi], beta[lo:hi], skip[lo:hi], maxlag, kept_stats[lo:hi]
+            )
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        )
+        stats = np.full(len(idx_a), np.nan)
+        pvalues = np.full(len(idx_a), np.nan)
+        stats[keep] = kept_stats
+        pvalues[keep] = np.fromiter(
+            (mackinnonp(stat, regression="c", N=2) for stat in kept_stats), dtype=np.float64, count=len(keep)
+        )
+        # Pivot column names are strings; restore the id column's own dtype.
+        labels = pl.Series(funds, dtype=pl.String).cast(df.schema[self.id_column])
+        return pl.DataFrame({
+            "fund_a": labels.gather(idx_a),
+            "fund_b": labels.gather(idx_b),
+            "coint_stat": stats,
+            "coint_pvalue": pvalues,
+        })
 
     def correlation_matrix(self, df: pl.DataFrame, value_column: str) -> pl.DataFrame:
-        pivot = df.pivot(index=self.date_column, columns=self.id_column, values=value_column)
-        corr = pivot.to_pandas().corr()
-        return pl.DataFrame(corr.reset_index().rename(columns={"index": self.id_column}))
+        """Pearson correlations using, for each pair, every date on which both funds are observed."""
+        funds, _, mat = self._get_pivot(df, value_column)
+        present = ~np.isnan(mat)
+        mask = present.astype(np.float64)
+        x = np.where(present, mat - np.nanmean(mat, axis=0), 0.0)
+        # Entry [i, j] of each product sums over the dates where funds i and j overlap.
+        n = mask.T @ mask
+        sx = x.T @ mask
+        sxx = (x * x).T @ mask
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = x.T @ x - sx * sx.T / n
+            var = sxx - sx * sx / n
+            corr = cov / np.sqrt(var * var.T)
+        return pl.from_numpy(corr, schema=funds).insert_column(0, pl.Series(self.id_column, funds))
 
     def plot_rolling_r_squared(
         self,
@@ -80,10 +331,23 @@ class StatisticalEvaluator:
         window: int = 63,
         output_path: Optional[Path] = None,
     ) -> None:
-        pivot = df.pivot(index=self.date_column, columns=self.id_column, values=value_column).to_pandas().dropna()
-        rolling = pivot.rolling(window).apply(lambda x: x.corr().pow(2).mean().mean(), raw=False)
+        _, dates, mat = self._get_pivot(df, value_column, complete=True)
+        mat = mat - mat.mean(axis=0)
+        idx_a, idx_b = np.triu_indices(mat.shape[1], k=1)
+        s1 = _window_sums(mat, window)
+        s2 = _window_sums(mat * mat, window)
+        var = window * s2 - s1 * s1
+        r2_sum = np.zeros(len(s1))
+        for lo in range(0, len(idx_a), _PAIR_BLOCK):
+            a, b = idx_a[lo : lo + _PAIR_BLOCK], idx_b[lo : lo + _PAIR_BLOCK]
+            sxy = _window_sums(mat[:, a] * mat[:, b], window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r = (window * sxy - s1[:, a] * s1[:, b]) / np.sqrt(var[:, a] * var[:, b])
+            r2_sum += (r * r).sum(axis=1)
+        rolling = np.full(len(mat), np.nan)
+        rolling[window - 1 :] = r2_sum / len(idx_a)
         plt.figure(figsize=(10, 4))
-        plt.plot(rolling.index, rolling.values)
+        plt.plot(dates.to_numpy(), rolling)
         plt.title("Rolling Average R-squared")
         plt.xlabel("Date")
         plt.ylabel("R-squared")
@@ -1,13 +1,20 @@
 """Visualization utilities for the quant research toolkit."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Tuple
 
+import matplotlib
 import polars as pl
 import plotly.express as px
-from matplotlib import pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+
+from ._plotting import draw_grouped_lines
+
+# Figures are only ever written to disk, so skip interactive backend probing.
+matplotlib.use("Agg")
 
 
 @dataclass
@@ -16,35 +23,91 @@ class Visualizer:
 
     id_column: str = "fund_id"
     date_column: str = "date"
+    _fig: Optional[Figure] = field(default=None, init=False, repr=False, compare=False)
+
+    def _axes(self, figsize: Tuple[float, float]) -> Tuple[Figure, Axes]:
+        """Return the reusable figure, cleared and resized, with a fresh axes.
+
+        The figure is built without pyplot, so it is never registered as an open
+        figure and is garbage-collected along with the visualizer.
+        """
+        if self._fig is None:
+            self._fig = Figure(figsize=figsize)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        return self._fig, self._fig.add_subplot()
+
+    def close(self) -> None:
+        """Release the figure shared by the plotting methods."""
+        self._fig = None
 
     def quant_score_bar(self, df: pl.DataFrame, output_path: Optional[Path] = None) -> None:
-        latest = df.sort(self.date_column).group_by(self.id_column).tail(1)
-        fig = px.bar(latest.to_pandas(), x=self.id_column, y="quant_score", title="Quant Score by Fund")
+        latest = df.group_by(self.id_column, maintain_order=True).agg(
+            pl.col("quant_score").sort_by(self.date_column).last().alias("quant_score"),
+            pl.col(self.date_column).max(),
+        )
         if output_path:
-            fig.write_image(output_path)
-        else:
-            fig.show()
+            self._render_matplotlib_bar(latest, output_path)
+            return
+        fig = px.bar(latest.to_pandas(), x=self.id_column, y="quant_score", title="Quant Score by Fund")
+        fig.show()
+
+    def _render_matplotlib_bar(self, latest: pl.DataFrame, output_path: Path) -> None:
+        """Static bar chart export, avoiding plotly's Kaleido subprocess."""
+        fig, ax = self._axes((10, 4))
+        ax.bar(latest[self.id_column].cast(pl.String).to_numpy(), latest["quant_score"].to_numpy())
+        ax.set_title("Quant Score by Fund")
+        ax.set_xlabel(self.id_column)
+        ax.set_ylabel("quant_score")
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=120)
 
     def decile_distribution(self, df: pl.DataFrame, output_path: Optional[Path] = None) -> None:
         counts = df.group_by([self.date_column, "quant_bucket"]).agg(pl.len().alias("count"))
-        pivot = counts.pivot(index=self.date_column, columns="quant_bucket", values="count")
-        pivot_pd = pivot.to_pandas().set_index(self.date_column)
-        pivot_pd.plot.area(figsize=(10, 6))
-        plt.title("Quant Score Decile Distribution")
-        plt.xlabel("Date")
-        plt.ylabel("Number of Funds")
-        plt.tight_layout()
+        pivot = (
+            counts.pivot(index=self.date_column, on="quant_bucket", values="count")
+            .fill_null(0)
+            .sort(self.date_column)
+        )
+        bucket_cols = [col for col in pivot.columns if col != self.date_column]
+        fig, ax = self._axes((10, 6))
+        ax.stackplot(
+            pivot[self.date_column].to_numpy(),
+            *[pivot[col].to_numpy() for col in bucket_cols],
+            labels=bucket_cols,
+        )
+        ax.legend(loc="upper left")
+        ax.set_title("Quant Score Decile Distribution")
+        ax.set_xlabel("Date")
+        ax.set_ylabel("Number of Funds")
+        fig.tight_layout()
         if output_path:
-            plt.savefig(output_path)
-        plt.close()
+            fig.savefig(output_path)
 
     def risk_heatmap(self, tidy_df: pl.DataFrame, output_path: Optional[Path] = None) -> None:
-        pivot = tidy_df.pivot(index=self.id_column, columns="metric", values="value")
-        fig = px.imshow(pivot.to_pandas(), labels=dict(color="Value"), title="Risk Factor Heatmap")
+        pivot = tidy_df.pivot(index=self.id_column, on="metric", values="value")
         if output_path:
-            fig.write_image(output_path)
-        else:
-            fig.show()
+            self._render_matplotlib_heatmap(pivot, output_path)
+            return
+        fig = px.imshow(
+            pivot.to_pandas().set_index(self.id_column),
+            labels=dict(color="Value"),
+            title="Risk Factor Heatmap",
+        )
+        fig.show()
+
+    def _render_matplotlib_heatmap(self, pivot: pl.DataFrame, output_path: Path) -> None:
+        """Static heatmap export, avoiding plotly's Kaleido subprocess."""
+        metrics = [col for col in pivot.columns if col != self.id_column]
+        fig, ax = self._axes((max(6, len(metrics)), max(4, 0.3 * pivot.height)))
+        image = ax.imshow(pivot.select(metrics).to_numpy().astype(float), aspect="auto")
+        ax.set_xticks(range(len(metrics)), metrics, rotation=45, ha="right")
+        ax.set_yticks(range(pivot.height), pivot[self.id_column].cast(pl.String).to_list())
+        ax.set_title("Risk Factor Heatmap")
+        fig.colorbar(image, ax=ax, label="Value")
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=120)
 
     def rolling_metric_plot(
         self,
@@ -52,14 +115,11 @@ class Visualizer:
         metric: str,
         output_path: Optional[Path] = None,
     ) -> None:
-        fig, ax = plt.subplots(figsize=(10, 4))
-        for fund_id, group in df.group_by(self.id_column):
-            ax.plot(group[self.date_column], group[metric], label=str(fund_id))
+        fig, ax = self._axes((10, 4))
+        draw_grouped_lines(ax, df, self.id_column, self.date_column, metric)
         ax.set_title(f"Rolling {metric}")
         ax.set_xlabel("Date")
         ax.set_ylabel(metric.replace("_", " ").title())
-        ax.legend()
-        plt.tight_layout()
+        fig.tight_layout()
         if output_path:
-            plt.savefig(output_path)
-        plt.close()
+            fig.savefig(output_path)
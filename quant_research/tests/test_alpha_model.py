@@ -0,0 +1,77 @@
+"""Tests for the factor regression utilities."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+np = pytest.importorskip("numpy")
+pl = pytest.importorskip("polars")
+sm = pytest.importorskip("statsmodels.api")
+
+from quant_research.src.alpha_model import AlphaModel
+
+
+@pytest.mark.parametrize("max_padding_ratio", [4.0, 0.0])
+def test_time_series_regression_matches_statsmodels(max_padding_ratio):
+    rng = np.random.default_rng(0)
+    frames = []
+    for fund_id, n_obs in [("A", 40), ("B", 25), ("C", 60), ("D", 30)]:
+        mkt = rng.normal(0.0, 0.01, n_obs)
+        # D's factors are collinear, so its design is rank deficient.
+        smb = 2 * mkt if fund_id == "D" else rng.normal(0.0, 0.01, n_obs)
+        excess = 0.001 + 0.8 * mkt - 0.3 * smb + rng.normal(0.0, 0.005, n_obs)
+        frames.append(
+            pl.DataFrame(
+                {
+                    "fund_id": [fund_id] * n_obs,
+                    "date": list(range(n_obs)),
+                    "excess_return": excess,
+                    "mkt": mkt,
+                    "smb": smb,
+                }
+            )
+        )
+    df = pl.concat(frames)
+    model = AlphaModel(max_padding_ratio=max_padding_ratio)
+    result = model.time_series_regression(df, ["mkt", "smb"]).sort("fund_id")
+    assert result["fund_id"].to_list() == ["A", "B", "C", "D"]
+    for row in result.iter_rows(named=True):
+        group = df.filter(pl.col("fund_id") == row["fund_id"])
+        X = sm.add_constant(group.select("mkt", "smb").to_numpy())
+        expected = sm.OLS(group["excess_return"].to_numpy(), X).fit()
+        assert row["alpha"] == pytest.approx(expected.params[0])
+        assert row["beta_mkt"] == pytest.approx(expected.params[1])
+        assert row["t_smb"] == pytest.approx(expected.tvalues[2])
+        assert row["alpha_t"] == pytest.approx(expected.tvalues[0])
+        assert row["r_squared"] == pytest.approx(expected.rsquared)
+
+
+@pytest.mark.parametrize("factors", [["mkt"], ["mkt", "smb"]])
+def test_cross_sectional_regression_matches_statsmodels(factors):
+    rng = np.random.default_rng(1)
+    n_funds, n_dates = 15, 4
+    df = pl.DataFrame(
+        {
+            "fund_id": [f"F{i}" for i in range(n_funds)] * n_dates,
+            "date": np.repeat(np.arange(n_dates), n_funds),
+            "excess_return": rng.normal(size=n_funds * n_dates),
+            "mkt": rng.normal(size=n_funds * n_dates),
+            "smb": rng.normal(size=n_funds * n_dates),
+        }
+    )
+    result = AlphaModel().cross_sectional_regression(df, factors)
+    assert result["date"].to_list() == list(range(n_dates))
+    for row in result.iter_rows(named=True):
+        group = df.filter(pl.col("date") == row["date"])
+        X = sm.add_constant(group.select(factors).to_numpy())
+        expected = sm.OLS(group["excess_return"].to_numpy(), X).fit()
+        assert row["r_squared"] == pytest.approx(expected.rsquared)
+        for k, factor in enumerate(factors, start=1):
+            assert row[f"lambda_{factor}"] == pytest.approx(expected.params[k])
+            assert row[f"t_{factor}"] == pytest.approx(expected.tvalues[k])
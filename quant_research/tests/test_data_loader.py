@@ -0,0 +1,63 @@
+"""Tests for the CSV loading cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+pl = pytest.importorskip("polars")
+
+from quant_research.src.data_loader import DataLoader
+
+
+def test_scan_caches_csv_as_parquet(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("fund_id,close\nA,1.0\nB,2.0\n")
+    own_parquet = tmp_path / "prices.parquet"
+    pl.DataFrame({"unrelated": [1]}).write_parquet(own_parquet)
+    cache_path = tmp_path / "prices.cache.parquet"
+    loader = DataLoader(tmp_path)
+
+    # First read parses the CSV and writes the cache next to it.
+    assert loader.load_prices_lazy("prices.csv").collect()["close"].to_list() == [1.0, 2.0]
+    assert cache_path.exists()
+    cached_mtime = cache_path.stat().st_mtime_ns
+
+    # Unchanged CSV: the cache is scanned and left as is.
+    lf = loader.load_prices_lazy("prices.csv")
+    assert "parquet" in lf.explain().lower()
+    assert lf.collect()["close"].to_list() == [1.0, 2.0]
+    assert cache_path.stat().st_mtime_ns == cached_mtime
+
+    # Touched CSV: it is re-parsed and the cache refreshed.
+    csv_path.write_text("fund_id,close\nA,3.0\nB,4.0\n")
+    os.utime(csv_path, ns=(cached_mtime + 10**9, cached_mtime + 10**9))
+    assert loader.load_prices_lazy("prices.csv").collect()["close"].to_list() == [3.0, 4.0]
+    assert cache_path.stat().st_mtime_ns > cached_mtime
+
+    # A user's own same-named Parquet file is never touched.
+    assert pl.read_parquet(own_parquet).columns == ["unrelated"]
+
+
+def test_interrupted_cache_write_leaves_no_cache(tmp_path, monkeypatch):
+    (tmp_path / "prices.csv").write_text("fund_id,close\nA,1.0\n")
+    loader = DataLoader(tmp_path)
+
+    def truncated_write(self, file, *args, **kwargs):
+        Path(file).write_bytes(b"PAR1")
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pl.DataFrame, "write_parquet", truncated_write)
+        assert loader.load_prices_lazy("prices.csv").collect()["close"].to_list() == [1.0]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["prices.csv"]
+
+    # The next run parses the CSV again and writes a valid cache.
+    assert loader.load_prices_lazy("prices.csv").collect()["close"].to_list() == [1.0]
+    assert (tmp_path / "prices.cache.parquet").exists()
@@ -15,19 +15,9 @@ pl = pytest.importorskip("polars")
 from quant_research.src.scoring_model import ScoreConfig, ScoringEngine
 
 
-def test_quant_score_ranking(tmp_path):
-    data = pl.DataFrame(
-        {
-            "fund_id": ["A", "B", "C"],
-            "date": ["2023-01-31"] * 3,
-            "volatility": [0.1, 0.2, 0.3],
-            "sharpe_ratio": [1.0, 0.5, 0.2],
-            "sortino_ratio": [1.1, 0.7, 0.4],
-            "max_drawdown": [-0.1, -0.2, -0.3],
-            "momentum_63": [0.05, 0.02, -0.01],
-        }
-    )
-    config_path = tmp_path / "config.yaml"
+@pytest.fixture(scope="session")
+def score_config(tmp_path_factory):
+    config_path = tmp_path_factory.mktemp("scoring") / "config.yaml"
     config_path.write_text(
         """
 weights:
@@ -38,7 +28,43 @@ weights:
   momentum_63: 0.6
 """
     )
-    config = ScoreConfig.from_yaml(config_path)
-    engine = ScoringEngine(config)
-    scored = engine.compute_scores(data)
+    return ScoreConfig.from_yaml(config_path)
+
+
+@pytest.fixture(scope="session")
+def sample_frame():
+    return pl.DataFrame(
+        {
+            "fund_id": ["A", "B", "C"],
+            "date": ["2023-01-31"] * 3,
+            "volatility": [0.1, 0.2, 0.3],
+            "sharpe_ratio": [1.0, 0.5, 0.2],
+            "sortino_ratio": [1.1, 0.7, 0.4],
+            "max_drawdown": [-0.1, -0.2, -0.3],
+            "momentum_63": [0.05, 0.02, -0.01],
+        }
+    )
+
+
+def test_quant_score_ranking(score_config, sample_frame):
+    scored = ScoringEngine(score_config).compute_scores(sample_frame)
     assert scored.sort("quant_rank")["fund_id"][0] == "A"
+
+
+def test_top_bottom_deciles_labels(score_config):
+    scores = pl.DataFrame(
+        {
+            "fund_id": [f"F{i}" for i in range(20)] + ["solo", "T1", "T2", "T3", "U1", "U2", "U3"],
+            "date": ["2023-01-31"] * 20 + ["2023-02-28"] + ["2023-03-31"] * 3 + ["2023-04-28"] * 3,
+            "quant_score": [float(i) for i in range(20)] + [1.5, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0],
+        }
+    )
+    buckets = ScoringEngine(score_config).top_bottom_deciles(scores)
+    label = dict(zip(buckets["fund_id"], buckets["quant_bucket"]))
+    assert label["F19"] == "top_decile"
+    assert label["F0"] == "bottom_decile"
+    assert label["F10"] == "middle"
+    assert label["solo"] == "middle"
+    # Fully tied dates have no tails; partial ties share the label of their rank.
+    assert [label[f"T{i}"] for i in (1, 2, 3)] == ["middle"] * 3
+    assert [label[f"U{i}"] for i in (1, 2, 3)] == ["middle", "middle", "top_decile"]
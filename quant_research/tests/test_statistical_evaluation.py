@@ -0,0 +1,108 @@
+"""Tests for the statistical diagnostics."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+np = pytest.importorskip("numpy")
+pl = pytest.importorskip("polars")
+stattools = pytest.importorskip("statsmodels.tsa.stattools")
+
+from joblib import parallel_config
+
+from quant_research.src.statistical_evaluation import StatisticalEvaluator
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_cointegration_matches_statsmodels(n_jobs):
+    rng = np.random.default_rng(0)
+    n_obs = 300
+    trend = np.cumsum(rng.normal(size=n_obs))
+    series = {
+        "A": trend + rng.normal(size=n_obs),
+        "B": 2 * trend + 5 + rng.normal(size=n_obs),
+        "C": np.cumsum(rng.normal(size=n_obs)),
+    }
+    df = pl.DataFrame(
+        {
+            "fund_id": np.repeat(list(series), n_obs),
+            "date": np.tile(np.arange(n_obs), len(series)),
+            "value": np.concatenate(list(series.values())),
+        }
+    )
+    # A caller-selected process backend must not break the shared result buffer.
+    with parallel_config(backend="loky"):
+        result = StatisticalEvaluator(n_jobs=n_jobs).cointegration_test(df, "value")
+    maxlag = int(12 * (n_obs / 100) ** 0.25)
+    assert result.height == 3
+    for row in result.iter_rows(named=True):
+        corr = np.corrcoef(series[row["fund_a"]], series[row["fund_b"]])[0, 1]
+        if abs(corr) < 0.3:
+            assert np.isnan(row["coint_stat"]) and np.isnan(row["coint_pvalue"])
+            continue
+        stat, pvalue, _ = stattools.coint(
+            series[row["fund_a"]], series[row["fund_b"]], maxlag=maxlag, autolag=None
+        )
+        assert row["coint_stat"] == pytest.approx(stat)
+        assert row["coint_pvalue"] == pytest.approx(pvalue)
+
+    numeric = df.with_columns(pl.col("fund_id").replace_strict({"A": 1, "B": 2, "C": 3}))
+    numeric_result = StatisticalEvaluator(n_jobs=1).cointegration_test(numeric, "value")
+    assert numeric_result.schema["fund_a"] == numeric.schema["fund_id"]
+    assert numeric_result["fund_b"].to_list() == [2, 3, 3]
+
+    # Too few aligned dates for Schwert's lag length: both implementations refuse.
+    short = df.filter(pl.col("date") < 12)
+    with pytest.raises(ValueError, match="maxlag"):
+        StatisticalEvaluator(n_jobs=1).cointegration_test(short, "value")
+    with pytest.raises(ValueError, match="maxlag"):
+        stattools.coint(series["A"][:12], series["B"][:12], maxlag=int(12 * 0.12**0.25), autolag=None)
+
+
+def test_run_all_diagnostics_matches_statsmodels():
+    sm_tools = pytest.importorskip("statsmodels.stats.stattools")
+    rng = np.random.default_rng(1)
+    n_obs = 120
+    df = pl.DataFrame(
+        {
+            "fund_id": np.repeat(["A", "B"], n_obs),
+            "date": np.tile(np.arange(n_obs), 2),
+            "value": rng.normal(size=2 * n_obs),
+            "resid": rng.normal(size=2 * n_obs),
+        }
+    ).reverse()
+    result = StatisticalEvaluator(n_jobs=1).run_all_diagnostics(df, "value", "resid")
+    for row in result.iter_rows(named=True):
+        group = df.filter(pl.col("fund_id") == row["fund_id"]).sort("date")
+        values = group["value"].to_numpy()
+        assert row["adf_stat"] == pytest.approx(stattools.adfuller(values, autolag="AIC")[0])
+        # Durbin-Watson and Jarque-Bera run in float32 by default.
+        assert row["durbin_watson"] == pytest.approx(
+            sm_tools.durbin_watson(group["resid"].to_numpy()), rel=1e-4
+        )
+        assert row["jarque_bera"] == pytest.approx(sm_tools.jarque_bera(values)[0], rel=1e-4)
+        assert row["jb_pvalue"] == pytest.approx(sm_tools.jarque_bera(values)[1], rel=1e-4)
+
+
+def test_correlation_matrix_uses_pairwise_complete_dates():
+    pytest.importorskip("pandas")
+    rng = np.random.default_rng(2)
+    n_obs = 100
+    frames = [
+        pl.DataFrame({"fund_id": fund_id, "date": np.arange(n_obs), "value": rng.normal(size=n_obs)})
+        for fund_id in ["A", "B", "C"]
+    ]
+    # D launches late, which must not change the correlations among A, B and C.
+    frames.append(pl.DataFrame({"fund_id": "D", "date": np.arange(80, n_obs), "value": rng.normal(size=20)}))
+    df = pl.concat(frames)
+    result = StatisticalEvaluator().correlation_matrix(df, "value")
+    expected = df.to_pandas().pivot(index="date", columns="fund_id", values="value").corr()
+    for row in result.iter_rows(named=True):
+        for fund_id in expected.columns:
+            assert row[fund_id] == pytest.approx(expected.loc[row["fund_id"], fund_id])